@@ -6,12 +6,34 @@ from dataclasses import dataclass, field
 import datetime
 from decimal import Decimal, InvalidOperation
 import logging
+from math import pow as _mpow
 from typing import Any, Dict
 
 from app.exceptions import OperationError
 
 
-@dataclass
+# Mapping of operation names to their corresponding functions. Built once at
+# import rather than on every calculate() call; the lambdas look up the
+# Calculation error helpers when they run.
+_OPERATIONS = {
+    "Addition": lambda x, y: x + y,
+    "Subtraction": lambda x, y: x - y,
+    "Multiplication": lambda x, y: x * y,
+    "Division": lambda x, y: x / y if y != 0 else Calculation._raise_div_zero(),
+    "Power": lambda x, y: Decimal(_mpow(float(x), float(y))) if y >= 0 else Calculation._raise_neg_power(),
+    "Root": lambda x, y: (
+        Decimal(_mpow(float(x), 1.0 / float(y)))
+        if x >= 0 and y != 0
+        else Calculation._raise_invalid_root(x, y)
+    ),
+    "Percent": lambda x, y: (x / y) * 100 if y != 0 else Calculation._raise_div_zero(),
+    "AbsoluteDiff": lambda x, y: abs(x - y),
+    "IntDivide": lambda x, y: x // y,
+    "Modulus": lambda x, y: x % y
+}
+
+
+@dataclass(slots=True)
 class Calculation:
     """
     Value Object representing a single calculation.
@@ -20,6 +42,7 @@ class Calculation:
     operation performed, operands involved, the result, and the timestamp of the
     calculation. It provides methods for performing the calculation, serializing
     the data for storage, and deserializing data to recreate a Calculation instance.
+    Instances are slotted to keep per-calculation memory down.
     """
 
     # Required fields
@@ -44,9 +67,9 @@ class Calculation:
         """
         Execute calculation using the specified operation.
 
-        Utilizes a dictionary to map operation names to their corresponding
-        lambda functions, enabling dynamic execution of operations based on
-        the operation name.
+        Utilizes the module-level _OPERATIONS dictionary to map operation names
+        to their corresponding lambda functions, enabling dynamic execution of
+        operations based on the operation name.
 
         Returns:
             Decimal: The result of the calculation.
@@ -54,27 +77,8 @@ class Calculation:
         Raises:
             OperationError: If the operation is unknown or the calculation fails.
         """
-        # Mapping of operation names to their corresponding functions
-        operations = {
-            "Addition": lambda x, y: x + y,
-            "Subtraction": lambda x, y: x - y,
-            "Multiplication": lambda x, y: x * y,
-            "Division": lambda x, y: x / y if y != 0 else self._raise_div_zero(),
-            "Power": lambda x, y: Decimal(pow(float(x), float(y))) if y >= 0 else self._raise_neg_power(),
-            "Root": lambda x, y: (
-                Decimal(pow(float(x), 1 / float(y))) 
-                if x >= 0 and y != 0 
-                else self._raise_invalid_root(x, y)
-            ),
-            "Percent": lambda x, y: (x / y) * 100 if y != 0 else self._raise_div_zero(),
-            "AbsoluteDiff": lambda x, y: abs(x - y),
-            "IntDivide": lambda x, y: x // y, 
-            "Modulus" : lambda x, y: x % y
-
-        }
-
         # Retrieve the operation function based on the operation name
-        op = operations.get(self.operation)
+        op = _OPERATIONS.get(self.operation)
         if not op:
             raise OperationError(f"Unknown operation: {self.operation}")
 
@@ -190,7 +194,7 @@ class Calculation:
         Returns:
             str: Formatted string showing the calculation and result.
         """
-        return f"{self.operation}({self.operand1}, {self.operand2}) = {self.result}" # pragma: no cover
+        return f"{self.operation}({self.operand1}, {self.operand2}) = {self.result}"
 
     def __repr__(self) -> str:
         """
@@ -12,7 +12,7 @@ import pandas as pd
 
 from app.calculation import Calculation
 from app.calculator_config import CalculatorConfig
-from app.calculator_memento import CalculatorMemento
+from app.calculator_memento import CalculatorMemento, HistoryDelta
 from app.exceptions import OperationError, ValidationError
 from app.history import HistoryObserver
 from app.input_validators import InputValidator
@@ -205,18 +205,19 @@ class Calculator:
                 operand2=validated_b
             )
 
-            # Save the current state to the undo stack before making changes
-            self.undo_stack.append(CalculatorMemento(self.history.copy()))
-
-            # Clear the redo stack since new operation invalidates the redo history
-            self.redo_stack.clear()
-
-            # Append the new calculation to the history
+            # Append the new calculation to the history, recording the change
+            deltas = [HistoryDelta('push', len(self.history), calculation)]
             self.history.append(calculation)
 
             # Ensure the history does not exceed the maximum size
             if len(self.history) > self.config.max_history_size:
-                self.history.pop(0)
+                deltas.append(HistoryDelta('pop', 0, self.history.pop(0)))
+
+            # Save the changes to the undo stack so they can be reverted
+            self.undo_stack.append(CalculatorMemento(deltas=deltas))
+
+            # Clear the redo stack since new operation invalidates the redo history
+            self.redo_stack.clear()
 
             # Notify all observers about the new calculation
             self.notify_observers(calculation)
@@ -246,16 +247,8 @@ class Calculator:
             # Ensure the history directory exists
             self.config.history_dir.mkdir(parents=True, exist_ok=True)
 
-            history_data = []
-            for calc in self.history:
-                # Serialize each Calculation instance to a dictionary
-                history_data.append({
-                    'operation': str(calc.operation),
-                    'operand1': str(calc.operand1),
-                    'operand2': str(calc.operand2),
-                    'result': str(calc.result),
-                    'timestamp': calc.timestamp.isoformat()
-                })
+            # Serialize each Calculation instance to a dictionary
+            history_data = [calc.to_dict() for calc in self.history]
 
             if history_data:
                 # Create a pandas DataFrame from the history data
@@ -300,6 +293,9 @@ class Calculator:
                         })
                         for _, row in df.iterrows()
                     ]
+                    # Recorded deltas refer to the replaced history, so drop them
+                    self.undo_stack.clear()
+                    self.redo_stack.clear()
                     logging.info(f"Loaded {len(self.history)} calculations from history")
                 else:
                     logging.info("Loaded empty history file") # pragma: no cover
@@ -341,10 +337,7 @@ class Calculator:
         Returns:
             List[str]: List of formatted calculation history entries.
         """
-        return [ # pragma: no cover
-            f"{calc.operation}({calc.operand1}, {calc.operand2}) = {calc.result}"
-            for calc in self.history
-        ]
+        return [str(calc) for calc in self.history]
 
     def clear_history(self) -> None:
         """
@@ -362,19 +355,19 @@ class Calculator:
         Undo the last operation.
 
         Restores the calculator's history to the state before the last calculation
-        was performed.
+        was performed by reverting the changes that calculation recorded.
 
         Returns:
             bool: True if an operation was undone, False if there was nothing to undo.
         """
         if not self.undo_stack:
             return False
-        # Pop the last state from the undo stack
+        # Pop the last recorded change from the undo stack
         memento = self.undo_stack.pop()
-        # Push the current state onto the redo stack
-        self.redo_stack.append(CalculatorMemento(self.history.copy()))
-        # Restore the history from the memento
-        self.history = memento.history.copy()
+        # Revert its deltas on the live history
+        memento.revert(self.history)
+        # The same memento reapplies the change on redo
+        self.redo_stack.append(memento)
         return True
 
     def redo(self) -> bool:
@@ -388,10 +381,10 @@ class Calculator:
         """
         if not self.redo_stack:
             return False
-        # Pop the last state from the redo stack
+        # Pop the last undone change from the redo stack
         memento = self.redo_stack.pop()
-        # Push the current state onto the undo stack
-        self.undo_stack.append(CalculatorMemento(self.history.copy()))
-        # Restore the history from the memento
-        self.history = memento.history.copy()
+        # Reapply its deltas on the live history
+        memento.apply(self.history)
+        # Make it undoable again
+        self.undo_stack.append(memento)
         return True
@@ -4,37 +4,245 @@
 
 from dataclasses import dataclass, field
 import datetime
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from app.calculation import Calculation
+from app.exceptions import OperationError
 
+_NS_PER_SECOND = 1_000_000_000
 
-@dataclass
+
+def _ns_to_datetime(timestamp_ns: int) -> datetime.datetime:
+    """
+    Convert epoch nanoseconds to a naive local datetime.
+
+    Whole seconds and microseconds are converted separately so no precision
+    is lost to float division.
+
+    Args:
+        timestamp_ns (int): Nanoseconds since the epoch.
+
+    Returns:
+        datetime.datetime: The matching local time.
+    """
+    seconds, remainder = divmod(timestamp_ns, _NS_PER_SECOND)
+    return datetime.datetime.fromtimestamp(seconds).replace(microsecond=remainder // 1000)
+
+
+def _datetime_to_ns(timestamp: datetime.datetime) -> int:
+    """
+    Convert a datetime to epoch nanoseconds.
+
+    Args:
+        timestamp (datetime.datetime): Naive local (or aware) datetime.
+
+    Returns:
+        int: Nanoseconds since the epoch.
+    """
+    seconds = int(timestamp.replace(microsecond=0).timestamp())
+    return seconds * _NS_PER_SECOND + timestamp.microsecond * 1000
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryDelta:
+    """
+    A single change to a calculation history.
+
+    A 'push' inserts calc at index; a 'pop' removes calc from index. Each
+    delta can be applied to a history or reverted from it in O(1) for
+    changes at the end of the list.
+    """
+
+    op: str                 # Kind of change: 'push' or 'pop'
+    index: int              # Position in the history the change applies to
+    calc: Calculation       # The calculation that was inserted or removed
+
+    def __post_init__(self):
+        """
+        Validate the delta kind.
+
+        Raises:
+            OperationError: If op is not 'push' or 'pop'.
+        """
+        if self.op not in ('push', 'pop'):
+            raise OperationError(f"Unknown history delta: {self.op}")
+
+    def apply(self, history: List[Calculation]) -> None:
+        """
+        Apply this change to a history in place.
+
+        Args:
+            history (List[Calculation]): History to modify.
+        """
+        if self.op == 'push':
+            history.insert(self.index, self.calc)
+        else:
+            history.pop(self.index)
+
+    def revert(self, history: List[Calculation]) -> None:
+        """
+        Undo this change on a history in place.
+
+        Args:
+            history (List[Calculation]): History to modify.
+        """
+        if self.op == 'push':
+            history.pop(self.index)
+        else:
+            history.insert(self.index, self.calc)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert delta to dictionary for serialization.
+
+        Returns:
+            Dict[str, Any]: A dictionary containing the delta in a serializable format.
+        """
+        return {
+            'op': self.op,
+            'index': self.index,
+            'calculation': self.calc.to_dict()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'HistoryDelta':
+        """
+        Create delta from dictionary.
+
+        Args:
+            data (Dict[str, Any]): Dictionary containing serialized delta data.
+
+        Returns:
+            HistoryDelta: A new instance of HistoryDelta with restored state.
+        """
+        return cls(
+            op=data['op'],
+            index=int(data['index']),
+            calc=Calculation.from_dict(data['calculation'])
+        )
+
+
+@dataclass(init=False, slots=True)
 class CalculatorMemento:
     """
     Stores calculator state for undo/redo functionality.
 
     The Memento pattern allows the Calculator to save its current state (history)
     so that it can be restored later. This enables features like undo and redo.
+    Rather than a full copy of the history, a memento records only the deltas
+    one calculator action made, so undo reverts them and redo reapplies them
+    on the live history. Only mementos built from a history snapshot can
+    report a full history; a delta memento knows nothing about the entries
+    it did not change. The creation time is stored as integer epoch
+    nanoseconds and exposed as a datetime through the timestamp property.
     """
 
-    history: List[Calculation]  # List of Calculation instances representing the calculator's history
-    timestamp: datetime.datetime = field(default_factory=datetime.datetime.now)  # Time when the memento was created
+    deltas: Tuple[HistoryDelta, ...]  # Changes made by one calculator action, in order
+    timestamp_ns: int  # Time when the memento was created, in epoch nanoseconds
+    is_snapshot: bool  # True when built from a full history rather than from deltas
+    _history: Optional[List[Calculation]] = field(default=None, repr=False, compare=False)
+
+    def __init__(
+        self,
+        history: Sequence[Calculation] = (),
+        timestamp_ns: Optional[int] = None,
+        deltas: Optional[Sequence[HistoryDelta]] = None
+    ):
+        """
+        Create a memento from deltas, or from a full history snapshot.
+
+        A snapshot is stored as one 'push' delta per calculation, so folding
+        the deltas onto an empty history reproduces it.
+
+        Args:
+            history (Sequence[Calculation], optional): History snapshot to store
+                when no deltas are given. Defaults to an empty history.
+            timestamp_ns (Optional[int], optional): Creation time in epoch
+                nanoseconds. Defaults to the current time.
+            deltas (Optional[Sequence[HistoryDelta]], optional): Changes to record.
+        """
+        self.is_snapshot = deltas is None
+        if deltas is None:
+            deltas = [HistoryDelta('push', i, calc) for i, calc in enumerate(history)]
+        self.deltas = tuple(deltas)
+        self.timestamp_ns = time.time_ns() if timestamp_ns is None else timestamp_ns
+        self._history = None
+
+    @property
+    def timestamp(self) -> datetime.datetime:
+        """
+        Creation time as a naive local datetime.
+
+        Returns:
+            datetime.datetime: Time when the memento was created.
+        """
+        return _ns_to_datetime(self.timestamp_ns)
+
+    @property
+    def history(self) -> List[Calculation]:
+        """
+        The history snapshot this memento was built from.
+
+        Rebuilt by folding the deltas onto an empty history on first access
+        and reused afterwards.
+
+        Returns:
+            List[Calculation]: The stored history.
+
+        Raises:
+            OperationError: If the memento records deltas rather than a snapshot.
+        """
+        if not self.is_snapshot:
+            raise OperationError(
+                "Delta mementos do not hold a full history; apply or revert them instead"
+            )
+        if self._history is None:
+            history: List[Calculation] = []
+            self.apply(history)
+            self._history = history
+        return self._history
+
+    def apply(self, history: List[Calculation]) -> None:
+        """
+        Reapply the recorded changes to a history in place (redo).
+
+        Args:
+            history (List[Calculation]): History to modify.
+        """
+        for delta in self.deltas:
+            delta.apply(history)
+
+    def revert(self, history: List[Calculation]) -> None:
+        """
+        Undo the recorded changes on a history in place (undo).
+
+        Args:
+            history (List[Calculation]): History to modify.
+        """
+        for delta in reversed(self.deltas):
+            delta.revert(history)
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert memento to dictionary.
 
         This method serializes the memento's state into a dictionary format,
-        making it easy to store or transmit.
+        making it easy to store or transmit. Snapshot mementos are written as
+        a 'history' list and delta mementos as a 'deltas' list.
 
         Returns:
             Dict[str, Any]: A dictionary containing the serialized state of the memento.
         """
-        return {
-            'history': [calc.to_dict() for calc in self.history],
-            'timestamp': self.timestamp.isoformat()
+        data: Dict[str, Any] = {
+            'timestamp': self.timestamp.isoformat(),
+            'timestamp_ns': self.timestamp_ns
         }
+        if self.is_snapshot:
+            data['history'] = [calc.to_dict() for calc in self.history]
+        else:
+            data['deltas'] = [delta.to_dict() for delta in self.deltas]
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'CalculatorMemento':
@@ -42,7 +250,10 @@ class CalculatorMemento:
         Create memento from dictionary.
 
         This class method deserializes a dictionary to recreate a CalculatorMemento
-        instance, restoring the calculator's history and timestamp.
+        instance, restoring the calculator's history and timestamp. Serialized
+        'deltas' are used when present, otherwise the 'history' snapshot. The
+        integer 'timestamp_ns' key is used when present; otherwise the ISO
+        'timestamp' string is parsed.
 
         Args:
             data (Dict[str, Any]): Dictionary containing serialized memento data.
@@ -50,7 +261,15 @@ class CalculatorMemento:
         Returns:
             CalculatorMemento: A new instance of CalculatorMemento with restored state.
         """
+        timestamp_ns = data.get('timestamp_ns')
+        if timestamp_ns is None:
+            timestamp_ns = _datetime_to_ns(datetime.datetime.fromisoformat(data['timestamp']))
+        if 'deltas' in data:
+            return cls(
+                deltas=[HistoryDelta.from_dict(delta) for delta in data['deltas']],
+                timestamp_ns=int(timestamp_ns)
+            )
         return cls(
             history=[Calculation.from_dict(calc) for calc in data['history']],
-            timestamp=datetime.datetime.fromisoformat(data['timestamp'])
+            timestamp_ns=int(timestamp_ns)
         )
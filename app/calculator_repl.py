@@ -4,12 +4,255 @@
 
 from decimal import Decimal
 import logging
+from typing import Callable, Dict
 
 from app.calculator import Calculator
 from app.exceptions import OperationError, ValidationError
 from app.history import AutoSaveObserver, LoggingObserver
 from app.operations import OperationFactory
 
+# Bound str.format methods for the messages printed on every calculation and
+# every unrecognised command
+_RESULT = "\nResult: {}".format
+_UNKNOWN = "Unknown command: '{}'. Type 'help' for available commands.".format
+
+
+def _do_help(calc: Calculator, command: str) -> bool:
+    """
+    Display available commands.
+
+    Lists every operation registered with the OperationFactory followed by
+    the built-in REPL commands.
+
+    Args:
+        calc (Calculator): The calculator the REPL is driving.
+        command (str): The command as typed; unused.
+
+    Returns:
+        bool: Always False, so the REPL keeps running.
+    """
+    print("\nAvailable commands:")
+    # print("  add, subtract, multiply, divide, power, root, percent, absolutediff, intdivide, modulo - Perform calculations")
+
+    # loop through the items registered via decorator
+    for operation_name , operation_cls in sorted(OperationFactory.available_operations().items()):
+        print(f" {operation_name} - Perform {operation_name} operation")
+
+    print("  history - Show calculation history")
+    print("  clear - Clear calculation history")
+    print("  undo - Undo the last calculation")
+    print("  redo - Redo the last undone calculation")
+    print("  save - Save calculation history to file")
+    print("  load - Load calculation history from file")
+    print("  exit - Exit the calculator")
+    return False
+
+
+def _do_exit(calc: Calculator, command: str) -> bool:
+    """
+    Save history and end the REPL.
+
+    A failed save is reported as a warning but does not prevent exiting.
+
+    Args:
+        calc (Calculator): The calculator the REPL is driving.
+        command (str): The command as typed; unused.
+
+    Returns:
+        bool: Always True, telling the REPL to stop.
+    """
+    try:
+        calc.save_history()
+        print("History saved successfully.")
+    except Exception as e:
+        print(f"Warning: Could not save history: {e}")
+    print("Goodbye!")
+    return True
+
+
+def _do_history(calc: Calculator, command: str) -> bool:
+    """
+    Display calculation history.
+
+    Prints each history entry numbered from 1, or a notice when empty.
+
+    Args:
+        calc (Calculator): The calculator the REPL is driving.
+        command (str): The command as typed; unused.
+
+    Returns:
+        bool: Always False, so the REPL keeps running.
+    """
+    history = calc.show_history()
+    if not history:
+        print("No calculations in history")
+    else:
+        print("\nCalculation History:")
+        for i, entry in enumerate(history, 1):
+            print(f"{i}. {entry}")
+    return False
+
+
+def _do_clear(calc: Calculator, command: str) -> bool:
+    """
+    Clear calculation history.
+
+    Also discards the undo and redo stacks.
+
+    Args:
+        calc (Calculator): The calculator the REPL is driving.
+        command (str): The command as typed; unused.
+
+    Returns:
+        bool: Always False, so the REPL keeps running.
+    """
+    calc.clear_history()
+    print("History cleared")
+    return False
+
+
+def _do_undo(calc: Calculator, command: str) -> bool:
+    """
+    Undo the last calculation.
+
+    Reports whether there was anything to undo.
+
+    Args:
+        calc (Calculator): The calculator the REPL is driving.
+        command (str): The command as typed; unused.
+
+    Returns:
+        bool: Always False, so the REPL keeps running.
+    """
+    if calc.undo():
+        print("Operation undone")
+    else:
+        print("Nothing to undo")
+    return False
+
+
+def _do_redo(calc: Calculator, command: str) -> bool:
+    """
+    Redo the last undone calculation.
+
+    Reports whether there was anything to redo.
+
+    Args:
+        calc (Calculator): The calculator the REPL is driving.
+        command (str): The command as typed; unused.
+
+    Returns:
+        bool: Always False, so the REPL keeps running.
+    """
+    if calc.redo():
+        print("Operation redone")
+    else:
+        print("Nothing to redo")
+    return False
+
+
+def _do_save(calc: Calculator, command: str) -> bool:
+    """
+    Save calculation history to file.
+
+    Errors are reported to the user rather than raised.
+
+    Args:
+        calc (Calculator): The calculator the REPL is driving.
+        command (str): The command as typed; unused.
+
+    Returns:
+        bool: Always False, so the REPL keeps running.
+    """
+    try:
+        calc.save_history()
+        print("History saved successfully")
+    except Exception as e:
+        print(f"Error saving history: {e}")
+    return False
+
+
+def _do_load(calc: Calculator, command: str) -> bool:
+    """
+    Load calculation history from file.
+
+    Errors are reported to the user rather than raised.
+
+    Args:
+        calc (Calculator): The calculator the REPL is driving.
+        command (str): The command as typed; unused.
+
+    Returns:
+        bool: Always False, so the REPL keeps running.
+    """
+    try:
+        calc.load_history()
+        print("History loaded successfully")
+    except Exception as e:
+        print(f"Error loading history: {e}")
+    return False
+
+
+def _do_operation(calc: Calculator, command: str) -> bool:
+    """
+    Prompt for two operands and perform an arithmetic operation.
+
+    Either prompt accepts 'cancel' to abort. Validation, operation and
+    unexpected errors are reported to the user rather than raised.
+
+    Args:
+        calc (Calculator): The calculator the REPL is driving.
+        command (str): The operation name to perform (e.g., 'add').
+
+    Returns:
+        bool: Always False, so the REPL keeps running.
+    """
+    try:
+        print("\nEnter numbers (or 'cancel' to abort):")
+        a = input("First number: ")
+        if a.lower() == 'cancel':
+            print("Operation cancelled")
+            return False
+        b = input("Second number: ")
+        if b.lower() == 'cancel':
+            print("Operation cancelled")
+            return False
+
+        # Create the appropriate operation instance using the Factory pattern
+        operation = OperationFactory.create_operation(command)
+        calc.set_operation(operation)
+
+        # Perform the calculation
+        result = calc.perform_operation(a, b)
+
+        # Normalize the result if it's a Decimal
+        if isinstance(result, Decimal):
+            result = result.normalize()
+
+        print(_RESULT(result))
+    except (ValidationError, OperationError) as e:
+        # Handle known exceptions related to validation or operation errors
+        print(f"Error: {e}")
+    except Exception as e:
+        # Handle any unexpected exceptions
+        print(f"Unexpected error: {e}")
+    return False
+
+
+# Built-in REPL commands mapped to their handlers. Each handler receives the
+# calculator and the command, and returns True when the REPL should stop.
+# Arithmetic commands are resolved through the OperationFactory registry.
+_HANDLERS: Dict[str, Callable[[Calculator, str], bool]] = {
+    'help': _do_help,
+    'exit': _do_exit,
+    'history': _do_history,
+    'clear': _do_clear,
+    'undo': _do_undo,
+    'redo': _do_redo,
+    'save': _do_save,
+    'load': _do_load,
+}
+
 
 def calculator_repl():
     """
@@ -30,124 +273,21 @@ def calculator_repl():
 
         while True:
             try:
-                # Prompt the user for a command
-                command = input("\nEnter command: ").lower().strip()
-
-                if command == 'help':
-                    # Display available commands
-                    print("\nAvailable commands:")
-                    # print("  add, subtract, multiply, divide, power, root, percent, absolutediff, intdivide, modulo - Perform calculations")
-                   
-                   # loop through the items registered via decorator
-                    for operation_name , operation_cls in sorted(OperationFactory.available_operations().items()):
-                        print(f" {operation_name} - Perform {operation_name} operation")
-
-                    print("  history - Show calculation history")
-                    print("  clear - Clear calculation history")
-                    print("  undo - Undo the last calculation")
-                    print("  redo - Redo the last undone calculation")
-                    print("  save - Save calculation history to file")
-                    print("  load - Load calculation history from file")
-                    print("  exit - Exit the calculator")
-                    continue
-
-                if command == 'exit':
-                    # Attempt to save history before exiting
-                    try:
-                        calc.save_history()
-                        print("History saved successfully.")
-                    except Exception as e:
-                        print(f"Warning: Could not save history: {e}")
-                    print("Goodbye!")
-                    break
+                # Prompt the user for a command; most input is already
+                # lowercase, so only pay for .lower() when it is not
+                command = input("\nEnter command: ").strip()
+                if not command.islower():
+                    command = command.lower()
 
-                if command == 'history':
-                    # Display calculation history
-                    history = calc.show_history()
-                    if not history:
-                        print("No calculations in history")
-                    else:
-                        print("\nCalculation History:")
-                        for i, entry in enumerate(history, 1):
-                            print(f"{i}. {entry}")
-                    continue
-
-                if command == 'clear':
-                    # Clear calculation history
-                    calc.clear_history()
-                    print("History cleared")
-                    continue
-
-                if command == 'undo':
-                    # Undo the last calculation
-                    if calc.undo():
-                        print("Operation undone")
-                    else:
-                        print("Nothing to undo")
-                    continue
-
-                if command == 'redo':
-                    # Redo the last undone calculation
-                    if calc.redo():
-                        print("Operation redone")
-                    else:
-                        print("Nothing to redo")
-                    continue
-
-                if command == 'save':
-                    # Save calculation history to file
-                    try:
-                        calc.save_history()
-                        print("History saved successfully")
-                    except Exception as e:
-                        print(f"Error saving history: {e}")
-                    continue
-
-                if command == 'load':
-                    # Load calculation history from file
-                    try:
-                        calc.load_history()
-                        print("History loaded successfully")
-                    except Exception as e:
-                        print(f"Error loading history: {e}")
-                    continue
-
-                #if command in ['add', 'subtract', 'multiply', 'divide', 'power', 'root','percent','absolutediff','intdivide','modulo']:
-                if command in OperationFactory.available_operations():
-                    # Perform the specified arithmetic operation
-                    try:
-                        print("\nEnter numbers (or 'cancel' to abort):")
-                        a = input("First number: ")
-                        if a.lower() == 'cancel':
-                            print("Operation cancelled")
-                            continue
-                        b = input("Second number: ")
-                        if b.lower() == 'cancel':
-                            print("Operation cancelled")
-                            continue
-
-                        # Create the appropriate operation instance using the Factory pattern
-                        operation = OperationFactory.create_operation(command)
-                        calc.set_operation(operation)
-
-                        # Perform the calculation
-                        result = calc.perform_operation(a, b)
-
-                        # Normalize the result if it's a Decimal
-                        if isinstance(result, Decimal):
-                            result = result.normalize()
-
-                        print(f"\nResult: {result}")
-                    except (ValidationError, OperationError) as e:
-                        # Handle known exceptions related to validation or operation errors
-                        print(f"Error: {e}")
-                    except Exception as e:
-                        # Handle any unexpected exceptions
-                        print(f"Unexpected error: {e}")
-                    continue
-
-                # Handle unknown commands
-                print(f"Unknown command: '{command}'. Type 'help' for available commands.")
+                handler = _HANDLERS.get(command)
+                if handler is None and OperationFactory.has_operation(command):
+                    handler = _do_operation
+
+                if handler is None:
+                    # Handle unknown commands
+                    print(_UNKNOWN(command))
+                elif handler(calc, command):
+                    break
 
             except KeyboardInterrupt:
                 # Handle Ctrl+C interruption gracefully
@@ -4,9 +4,16 @@
 
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Dict
+from math import pow as _mpow
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
 from app.exceptions import ValidationError
 
+# Below this many elements NumPy's per-call overhead outweighs its speedup
+NUMPY_MIN_BATCH = 32
+
 # standalone decorator method to register an operation 
 
 class Operation(ABC):
@@ -17,6 +24,11 @@ class Operation(ABC):
     implement the execute method and can optionally override operand validation.
     """
 
+    __slots__ = ()
+
+    # NumPy ufunc used by execute_many; None means no vectorized form exists
+    ufunc: Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]] = None
+
     @abstractmethod
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
@@ -52,6 +64,62 @@ class Operation(ABC):
         """
         pass
 
+    def validate_many(self, a: np.ndarray, b: np.ndarray) -> None:
+        """
+        Validate operand arrays before vectorized execution.
+
+        Array counterpart of validate_operands; subclasses with operand
+        restrictions override both.
+
+        Args:
+            a (np.ndarray): First operands.
+            b (np.ndarray): Second operands.
+
+        Raises:
+            ValidationError: If any operand pair is invalid.
+        """
+        pass
+
+    @classmethod
+    def execute_many(cls, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        Execute the operation over arrays of operand pairs.
+
+        Large batches are dispatched to the class's NumPy ufunc in one pass.
+        Small batches, and operations without a ufunc, fall back to calling
+        execute on each pair. Results are float64, so this is meant for bulk
+        work where Decimal precision is not required. This is a public batch
+        helper for callers of the package; nothing in the app calls it, since
+        Calculator keeps its history in Decimal.
+
+        Args:
+            a (np.ndarray): First operands.
+            b (np.ndarray): Second operands.
+
+        Returns:
+            np.ndarray: Element-wise results as float64.
+
+        Raises:
+            ValidationError: If any operand pair is invalid.
+            ValueError: If a and b differ in length, or a row fails the same
+                way execute would fail on it.
+            OverflowError: If a row overflows the same way execute would.
+        """
+        a = np.asarray(a, dtype=np.float64)
+        b = np.asarray(b, dtype=np.float64)
+        if len(a) != len(b):
+            raise ValueError(
+                f"Operand length mismatch: {len(a)} first operands, {len(b)} second operands"
+            )
+        operation = cls()
+        if cls.ufunc is None or len(a) < NUMPY_MIN_BATCH:
+            return np.array(
+                [float(operation.execute(Decimal(x), Decimal(y))) for x, y in zip(a, b)],
+                dtype=np.float64
+            )
+        operation.validate_many(a, b)
+        return cls.ufunc(a, b)
+
     def __str__(self) -> str:
         """
         Return operation name for display.
@@ -75,6 +143,9 @@ class OperationFactory:
     # will fill dictionary with operations via decorator
     _operations: Dict[str, type] = {}
 
+    # shared instance per operation name; operations are stateless
+    _instances: Dict[str, Operation] = {}
+
     @classmethod
     def register_operation(cls, name: str, operation_class: type) -> None:
         """
@@ -92,6 +163,7 @@ class OperationFactory:
         if not issubclass(operation_class, Operation):
             raise TypeError("Operation class must inherit from Operation")
         cls._operations[name.lower()] = operation_class
+        cls._instances.pop(name.lower(), None)
 
     @classmethod
     def create_operation(cls, operation_type: str) -> Operation:
@@ -99,7 +171,8 @@ class OperationFactory:
         Create an operation instance based on the operation type.
 
         This method retrieves the appropriate operation class from the
-        _operations dictionary and instantiates it.
+        _operations dictionary and instantiates it. Operations hold no state,
+        so the instance is cached and reused on subsequent calls.
 
         Args:
             operation_type (str): The type of operation to create (e.g., 'add').
@@ -110,11 +183,34 @@ class OperationFactory:
         Raises:
             ValueError: If the operation type is unknown.
         """
-        operation_class = cls._operations.get(operation_type.lower())
-        if not operation_class:
-            raise ValueError(f"Unknown operation: {operation_type}")
-        return operation_class()
+        # Registered names are already lowercase, so typical REPL input hits
+        # the cache without paying for a .lower() call
+        operation = cls._instances.get(operation_type)
+        if operation is None:
+            name = operation_type.lower()
+            operation = cls._instances.get(name)
+            if operation is None:
+                operation_class = cls._operations.get(name)
+                if not operation_class:
+                    raise ValueError(f"Unknown operation: {operation_type}")
+                operation = cls._instances[name] = operation_class()
+        return operation
     
+    @classmethod
+    def has_operation(cls, name: str) -> bool:
+        """
+        Check whether an operation is registered under a name.
+
+        Unlike available_operations, this does not copy the registry.
+
+        Args:
+            name (str): Lowercase operation identifier (e.g., 'add').
+
+        Returns:
+            bool: True if the name is registered.
+        """
+        return name in cls._operations
+
     @classmethod
     def available_operations(cls) -> Dict[str, type]:
         """
@@ -147,6 +243,9 @@ class Addition(Operation):
     Performs the addition of two numbers.
     """
 
+    __slots__ = ()
+    ufunc = np.add
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
         Add two numbers.
@@ -169,6 +268,9 @@ class Subtraction(Operation):
     Performs the subtraction of one number from another.
     """
 
+    __slots__ = ()
+    ufunc = np.subtract
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
         Subtract one number from another.
@@ -191,6 +293,9 @@ class Multiplication(Operation):
     Performs the multiplication of two numbers.
     """
 
+    __slots__ = ()
+    ufunc = np.multiply
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
         Multiply two numbers.
@@ -213,6 +318,9 @@ class Division(Operation):
     Performs the division of one number by another.
     """
 
+    __slots__ = ()
+    ufunc = np.divide
+
     def validate_operands(self, a: Decimal, b: Decimal) -> None:
         """
         Validate operands, checking for division by zero.
@@ -230,6 +338,21 @@ class Division(Operation):
         if b == 0:
             raise ValidationError("Division by zero is not allowed")
 
+    def validate_many(self, a: np.ndarray, b: np.ndarray) -> None:
+        """
+        Validate operand arrays, checking for division by zero.
+
+        Args:
+            a (np.ndarray): Dividends.
+            b (np.ndarray): Divisors.
+
+        Raises:
+            ValidationError: If any divisor is zero.
+        """
+        super().validate_many(a, b)
+        if np.any(b == 0):
+            raise ValidationError("Division by zero is not allowed")
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
         Divide one number by another.
@@ -252,6 +375,9 @@ class Power(Operation):
     Raises one number to the power of another.
     """
 
+    __slots__ = ()
+    ufunc = np.power
+
     def validate_operands(self, a: Decimal, b: Decimal) -> None:
         """
         Validate operands for power operation.
@@ -269,6 +395,54 @@ class Power(Operation):
         if b < 0:
             raise ValidationError("Negative exponents not supported")
 
+    def validate_many(self, a: np.ndarray, b: np.ndarray) -> None:
+        """
+        Validate operand arrays, checking for negative exponents.
+
+        Args:
+            a (np.ndarray): Base numbers.
+            b (np.ndarray): Exponents.
+
+        Raises:
+            ValidationError: If any exponent is negative.
+            ValueError: If a negative base has a non-integer exponent, matching
+                the math domain error raised by execute.
+        """
+        super().validate_many(a, b)
+        if np.any(b < 0):
+            raise ValidationError("Negative exponents not supported")
+        if np.any((a < 0) & (b != np.floor(b))):
+            raise ValueError("math domain error")
+
+    @classmethod
+    def execute_many(cls, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        Raise arrays of bases to arrays of exponents.
+
+        np.power returns inf on overflow where math.pow raises, so rows with
+        finite operands but a non-finite result are rejected to keep both
+        paths consistent. Infinite or NaN operands pass through, as they do
+        with math.pow.
+
+        Args:
+            a (np.ndarray): Base numbers.
+            b (np.ndarray): Exponents.
+
+        Returns:
+            np.ndarray: Element-wise results as float64.
+
+        Raises:
+            ValidationError: If any exponent is negative.
+            ValueError: If a negative base has a non-integer exponent.
+            OverflowError: If any result from finite operands is too large to represent.
+        """
+        with np.errstate(over='ignore'):
+            result = super().execute_many(a, b)
+        overflowed = np.isfinite(a) & np.isfinite(b) & ~np.isfinite(result)
+        if np.any(overflowed):
+            raise OverflowError("math range error")
+        return result
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
         Calculate one number raised to the power of another.
@@ -281,7 +455,7 @@ class Power(Operation):
             Decimal: Result of the exponentiation.
         """
         self.validate_operands(a, b)
-        return Decimal(pow(float(a), float(b)))
+        return Decimal(_mpow(float(a), float(b)))
 
 @register_operation("root")
 class Root(Operation):
@@ -291,6 +465,8 @@ class Root(Operation):
     Calculates the nth root of a number.
     """
 
+    __slots__ = ()
+
     def validate_operands(self, a: Decimal, b: Decimal) -> None:
         """
         Validate operands for root operation.
@@ -323,7 +499,8 @@ class Root(Operation):
             Decimal: Result of the root calculation.
         """
         self.validate_operands(a, b)
-        return Decimal(pow(float(a), 1 / float(b)))
+        exponent = 1.0 if b == 1 else 1.0 / float(b)
+        return Decimal(_mpow(float(a), exponent))
 
 @register_operation("percent")
 class Percent(Operation):
@@ -333,6 +510,8 @@ class Percent(Operation):
     Calculates the percentage of one number with respect to another
     """
 
+    __slots__ = ()
+
     def validate_operands(self, a: Decimal, b: Decimal) -> None:
         """
         Validate operands, checking for division by zero.
@@ -372,6 +551,8 @@ class AbsoluteDiff(Operation):
     Performs the subtraction of one number from another and returns the aboslute difference.
     """
 
+    __slots__ = ()
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
         Subtract one number from another and return the aboslute difference.
@@ -394,6 +575,8 @@ class IntDivide(Operation):
     Performs the floor division of one number by another.
     """
 
+    __slots__ = ()
+
     def validate_operands(self, a: Decimal, b: Decimal) -> None:
         """
         Validate operands, checking for division by zero.
@@ -433,6 +616,8 @@ class Modulus(Operation):
     Performs the modulo of one number by another.
     """
 
+    __slots__ = ()
+
     def validate_operands(self, a: Decimal, b: Decimal) -> None:
         """
         Validate operands, checking for division by zero.
@@ -0,0 +1,27 @@
+import pytest
+
+from tests.helpers import Recorder
+
+
+# Fixture replacing print with a Recorder
+@pytest.fixture
+def stub_print(monkeypatch):
+    recorder = Recorder()
+    monkeypatch.setattr('builtins.print', recorder)
+    return recorder
+
+# Fixture returning a function that scripts the values input() will return;
+# exception classes or instances in the script are raised instead of returned
+@pytest.fixture
+def stub_input(monkeypatch):
+    def _feed(inputs):
+        feed = iter(inputs)
+        def _input(prompt=''):
+            value = next(feed)
+            if isinstance(value, BaseException) or (
+                isinstance(value, type) and issubclass(value, BaseException)
+            ):
+                raise value
+            return value
+        monkeypatch.setattr('builtins.input', _input)
+    return _feed
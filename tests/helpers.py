@@ -0,0 +1,20 @@
+class Recorder:
+    """
+    Minimal call-recording stand-in for Mock.
+
+    Stores the positional arguments of every call in `calls`, then raises
+    `error` if one was given, otherwise returns `result`.
+    """
+
+    __slots__ = ('calls', 'result', 'error')
+
+    def __init__(self, result=None, error=None):
+        self.calls = []
+        self.result = result
+        self.error = error
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append(args)
+        if self.error is not None:
+            raise self.error
+        return self.result
@@ -115,6 +115,13 @@ def test_equality():
     assert calc1 != calc3
 
 
+def test_str_reflects_current_fields():
+    calc = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
+    assert str(calc) == "Addition(2, 3) = 5"
+    calc.result = Decimal("6")
+    assert str(calc) == "Addition(2, 3) = 6"
+
+
 # New Test to Cover Logging Warning
 def test_from_dict_result_mismatch(caplog):
     """
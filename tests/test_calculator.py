@@ -111,6 +111,49 @@ def test_redo(calculator):
     calculator.redo()
     assert len(calculator.history) == 1
 
+def test_undo_redo_with_trimmed_history(calculator):
+    calculator.config.max_history_size = 2
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 1)
+    calculator.perform_operation(2, 2)
+    calculator.perform_operation(3, 3)
+    calculator.undo()
+    assert [calc.operand1 for calc in calculator.history] == [Decimal("1"), Decimal("2")]
+    calculator.redo()
+    assert [calc.operand1 for calc in calculator.history] == [Decimal("2"), Decimal("3")]
+
+def test_mementos_record_deltas_for_trimmed_history(calculator):
+    calculator.config.max_history_size = 2
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    for n in range(3):
+        calculator.perform_operation(n, 1)
+    memento = calculator.undo_stack[-1]
+    assert not memento.is_snapshot
+    with pytest.raises(OperationError, match="Delta mementos do not hold a full history"):
+        memento.history
+    result = memento.to_dict()
+    assert "history" not in result
+    assert [delta["op"] for delta in result["deltas"]] == ["push", "pop"]
+
+    # Deserialized deltas still undo the trimmed operation correctly
+    live = list(calculator.history)
+    CalculatorMemento.from_dict(result).revert(live)
+    assert [calc.operand1 for calc in live] == [Decimal("0"), Decimal("1")]
+
+def test_alternating_undo_redo_reuses_mementos(calculator):
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 1)
+    calculator.perform_operation(2, 2)
+    calculation = calculator.history[-1]
+    memento = calculator.undo_stack[-1]
+    for _ in range(3):
+        calculator.undo()
+        assert calculator.redo_stack == [memento]
+        calculator.redo()
+        assert calculator.undo_stack[-1] is memento
+    assert calculator.history[-1] is calculation
+    assert len(calculator.undo_stack) == 2
+
 # Test History Management
 
 @patch('app.calculator.pd.DataFrame.to_csv')
@@ -197,3 +240,9 @@ def test_history_trims_to_max_size(calculator):
     assert calculator.history[0].operand1 == Decimal("2")
     assert calculator.history[1].operand1 == Decimal("3")
 
+
+
+def test_show_history(calculator):
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 2)
+    assert calculator.show_history() == ["Addition(1, 2) = 3"]
@@ -1,17 +1,8 @@
 import datetime
-from pathlib import Path
-import pandas as pd
-import pytest
-from unittest.mock import Mock, patch, PropertyMock
 from decimal import Decimal
-from tempfile import TemporaryDirectory
-from app.calculator import Calculator
-from app.calculator_repl import calculator_repl
-from app.calculator_config import CalculatorConfig
-from app.exceptions import OperationError, ValidationError
-from app.history import LoggingObserver, AutoSaveObserver
-from app.operations import OperationFactory
-from app.calculator_memento import CalculatorMemento
+import pytest
+from app.calculator_memento import CalculatorMemento, HistoryDelta
+from app.exceptions import OperationError
 from app.calculation import Calculation
 
 # Calculator_memento.py tests
@@ -58,3 +49,80 @@ def test_memento_from_dict():
     assert restored_memento.history[0].result == Decimal("5")
     assert isinstance(restored_memento.timestamp, datetime.datetime)
     assert restored_memento.timestamp.isoformat() == saved_data["timestamp"]
+
+def test_memento_history_is_a_snapshot():
+    """Ensure the memento is unaffected by later changes to the source list."""
+
+    # Arrange
+    history = [Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))]
+    memento = CalculatorMemento(history)
+
+    # Act
+    history.append(Calculation(operation="Subtraction", operand1=Decimal("5"), operand2=Decimal("1")))
+
+    # Assert
+    assert len(memento.history) == 1
+    assert memento.history is memento.history # folded once and reused
+
+def test_memento_apply_and_revert_deltas():
+    """Ensure a memento reverts and reapplies its deltas on a live history."""
+
+    # Arrange
+    first = Calculation(operation="Addition", operand1=Decimal("1"), operand2=Decimal("1"))
+    second = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("2"))
+    history = [first, second]
+    memento = CalculatorMemento(deltas=[HistoryDelta('push', 1, second), HistoryDelta('pop', 0, first)])
+    history.pop(0)
+
+    # Act / Assert
+    memento.revert(history)
+    assert history == [first]
+    memento.apply(history)
+    assert history == [second]
+
+def test_memento_deltas_round_trip():
+    """Ensure serialized deltas are restored by from_dict."""
+
+    # Arrange
+    pushed = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
+    popped = Calculation(operation="Addition", operand1=Decimal("1"), operand2=Decimal("1"))
+    memento = CalculatorMemento(deltas=[HistoryDelta('push', 2, pushed), HistoryDelta('pop', 0, popped)])
+
+    # Act
+    result = memento.to_dict()
+    restored_memento = CalculatorMemento.from_dict(result)
+
+    # Assert
+    assert "history" not in result
+    assert [delta["op"] for delta in result["deltas"]] == ["push", "pop"]
+    assert restored_memento.deltas == memento.deltas
+    assert not restored_memento.is_snapshot
+
+def test_delta_memento_has_no_history():
+    """Ensure a delta memento refuses to report a full history."""
+    calc = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
+    memento = CalculatorMemento(deltas=[HistoryDelta('push', 0, calc)])
+    with pytest.raises(OperationError, match="Delta mementos do not hold a full history"):
+        memento.history
+
+def test_history_delta_rejects_unknown_op():
+    """Ensure only push and pop deltas can be created."""
+    calc = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
+    with pytest.raises(OperationError, match="Unknown history delta: clear"):
+        HistoryDelta('clear', 0, calc)
+
+def test_memento_timestamp_ns_round_trip():
+    """Ensure the integer timestamp survives to_dict/from_dict unchanged."""
+
+    # Arrange
+    memento = CalculatorMemento(history=[])
+
+    # Act
+    result = memento.to_dict()
+    restored_memento = CalculatorMemento.from_dict(result)
+
+    # Assert
+    assert isinstance(result["timestamp_ns"], int)
+    assert restored_memento.timestamp_ns == memento.timestamp_ns
+    assert restored_memento.timestamp == memento.timestamp
+    assert memento.timestamp.isoformat() == result["timestamp"]
@@ -1,169 +1,153 @@
-
-import datetime
-from pathlib import Path
-import pandas as pd
 import pytest
-from unittest.mock import Mock, patch, PropertyMock
-from decimal import Decimal
-from tempfile import TemporaryDirectory
 from app.calculator import Calculator
 from app.calculator_repl import calculator_repl
-from app.calculator_config import CalculatorConfig
-from app.exceptions import OperationError, ValidationError
-from app.history import LoggingObserver, AutoSaveObserver
-from app.operations import OperationFactory
-from app.calculator_memento import CalculatorMemento
-from app.calculation import Calculation
+from app.exceptions import ValidationError
+from tests.helpers import Recorder
+
+# Point every REPL Calculator at per-test log/history paths so tests can run in parallel
+@pytest.fixture(autouse=True)
+def isolated_calculator_paths(monkeypatch, tmp_path):
+    monkeypatch.setenv('CALCULATOR_LOG_DIR', str(tmp_path / "logs"))
+    monkeypatch.setenv('CALCULATOR_LOG_FILE', str(tmp_path / "logs/calculator.log"))
+    monkeypatch.setenv('CALCULATOR_HISTORY_DIR', str(tmp_path / "history"))
+    monkeypatch.setenv('CALCULATOR_HISTORY_FILE', str(tmp_path / "history/calculator_history.csv"))
 
-# Test REPL Commands (using patches for input/output handling)
+# Test REPL Commands (using stub_input/stub_print fixtures for input/output handling)
 
-@patch('builtins.input', side_effect=['exit'])
-@patch('builtins.print')
-def test_calculator_repl_exit(mock_print, mock_input):
-    with patch('app.calculator.Calculator.save_history') as mock_save_history:
-        calculator_repl()
-        mock_save_history.assert_called_once()
-        mock_print.assert_any_call("History saved successfully.")
-        mock_print.assert_any_call("Goodbye!")
+def test_calculator_repl_exit(stub_input, stub_print, monkeypatch):
+    save_history = Recorder()
+    monkeypatch.setattr(Calculator, 'save_history', save_history)
+    stub_input(['exit'])
+    calculator_repl()
+    assert len(save_history.calls) == 1
+    assert ("History saved successfully.",) in stub_print.calls
+    assert ("Goodbye!",) in stub_print.calls
 
-@patch('builtins.input', side_effect=['help', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_help(mock_print, mock_input):
+def test_calculator_repl_help(stub_input, stub_print):
+    stub_input(['help', 'exit'])
     calculator_repl()
-    mock_print.assert_any_call("\nAvailable commands:")
+    assert ("\nAvailable commands:",) in stub_print.calls
 
-@patch('builtins.input', side_effect=['add', '2', '3', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_addition(mock_print, mock_input):
+def test_calculator_repl_addition(stub_input, stub_print):
+    stub_input(['add', '2', '3', 'exit'])
     calculator_repl()
-    mock_print.assert_any_call("\nResult: 5")
+    assert ("\nResult: 5",) in stub_print.calls
 
 
-@patch('builtins.input', side_effect=['clear', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_clear(mock_print, mock_input):
+def test_calculator_repl_mixed_case_command(stub_input, stub_print):
+    stub_input(['  aDd ', '2', '3', 'EXIT'])
+    calculator_repl()
+    assert ("\nResult: 5",) in stub_print.calls
+    assert ("Goodbye!",) in stub_print.calls
+
+def test_calculator_repl_clear(stub_input, stub_print):
+    stub_input(['clear', 'exit'])
     calculator_repl()
-    mock_print.assert_any_call("History cleared")
+    assert ("History cleared",) in stub_print.calls
 
-@patch('builtins.input', side_effect=['add', '2', '3','undo', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_undo_positive(mock_print, mock_input):
+def test_calculator_repl_undo_positive(stub_input, stub_print):
+    stub_input(['add', '2', '3','undo', 'exit'])
     calculator_repl()
-    mock_print.assert_any_call("Operation undone")
+    assert ("Operation undone",) in stub_print.calls
 
-@patch('builtins.input', side_effect=['undo', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_undo_err(mock_print, mock_input):
+def test_calculator_repl_undo_err(stub_input, stub_print):
+    stub_input(['undo', 'exit'])
     calculator_repl()
-    mock_print.assert_any_call("Nothing to undo")
+    assert ("Nothing to undo",) in stub_print.calls
 
-@patch('builtins.input', side_effect=['add', '2', '3','undo','redo', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_redo_positive(mock_print, mock_input):
+def test_calculator_repl_redo_positive(stub_input, stub_print):
+    stub_input(['add', '2', '3','undo','redo', 'exit'])
     calculator_repl()
-    mock_print.assert_any_call("Operation redone")
+    assert ("Operation redone",) in stub_print.calls
 
-@patch('builtins.input', side_effect=['redo', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_redo_err(mock_print, mock_input):
+def test_calculator_repl_redo_err(stub_input, stub_print):
+    stub_input(['redo', 'exit'])
     calculator_repl()
-    mock_print.assert_any_call("Nothing to redo")
+    assert ("Nothing to redo",) in stub_print.calls
 
-@patch('app.calculator.Calculator.show_history', return_value=[])
-@patch('builtins.input', side_effect=['history', 'exit'])
-@patch('builtins.print')
-def test_calculator_history_empty(mock_print, mock_input, mock_show_history):
+def test_calculator_history_empty(stub_input, stub_print, monkeypatch):
+    show_history = Recorder(result=[])
+    monkeypatch.setattr(Calculator, 'show_history', show_history)
+    stub_input(['history', 'exit'])
     calculator_repl()
-    mock_print.assert_any_call("No calculations in history")
-    mock_show_history.assert_called_once()
+    assert ("No calculations in history",) in stub_print.calls
+    assert len(show_history.calls) == 1
 
-@patch('app.calculator.Calculator.show_history', return_value=["Addition(1, 2) = 3"])
-@patch('builtins.input', side_effect=['add','1','2','history', 'exit'])
-@patch('builtins.print')
-def test_calculator_show_history(mock_print, mock_input, mock_show_history):
+def test_calculator_show_history(stub_input, stub_print, monkeypatch):
+    show_history = Recorder(result=["Addition(1, 2) = 3"])
+    monkeypatch.setattr(Calculator, 'show_history', show_history)
+    stub_input(['add','1','2','history', 'exit'])
     calculator_repl()
-    mock_print.assert_any_call("\nCalculation History:")
-    mock_print.assert_any_call("1. Addition(1, 2) = 3")
-    mock_show_history.assert_called_once()
+    assert ("\nCalculation History:",) in stub_print.calls
+    assert ("1. Addition(1, 2) = 3",) in stub_print.calls
+    assert len(show_history.calls) == 1
 
-@patch('app.calculator.Calculator.load_history')
-@patch('builtins.input', side_effect=['load', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_load_positive(mock_print, mock_input, mock_load):
-    mock_load.return_value = None
+def test_calculator_repl_load_positive(stub_input, stub_print, monkeypatch):
+    monkeypatch.setattr(Calculator, 'load_history', Recorder())
+    stub_input(['load', 'exit'])
     calculator_repl()
-    mock_print.assert_any_call("History loaded successfully")
+    assert ("History loaded successfully",) in stub_print.calls
 
-@patch('app.calculator.Calculator.load_history', side_effect=Exception("File not found"))
-@patch('builtins.input', side_effect=['load', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_load_err(mock_print, mock_input, mock_load):
+def test_calculator_repl_load_err(stub_input, stub_print, monkeypatch):
+    monkeypatch.setattr(Calculator, 'load_history', Recorder(error=Exception("File not found")))
+    stub_input(['load', 'exit'])
     calculator_repl()
-    mock_print.assert_any_call("Error loading history: File not found")
+    assert ("Error loading history: File not found",) in stub_print.calls
 
-@patch('app.calculator.Calculator.save_history')
-@patch('builtins.input', side_effect=['save', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_save_positive(mock_print, mock_input, mock_load):
-    mock_load.return_value = None
+def test_calculator_repl_save_positive(stub_input, stub_print, monkeypatch):
+    monkeypatch.setattr(Calculator, 'save_history', Recorder())
+    stub_input(['save', 'exit'])
     calculator_repl()
-    mock_print.assert_any_call("History saved successfully")
+    assert ("History saved successfully",) in stub_print.calls
 
-@patch('app.calculator.Calculator.save_history', side_effect=Exception("File not found"))
-@patch('builtins.input', side_effect=['save', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_save_err(mock_print, mock_input, mock_load):
+def test_calculator_repl_save_err(stub_input, stub_print, monkeypatch):
+    monkeypatch.setattr(Calculator, 'save_history', Recorder(error=Exception("File not found")))
+    stub_input(['save', 'exit'])
     calculator_repl()
-    mock_print.assert_any_call("Error saving history: File not found")
+    assert ("Error saving history: File not found",) in stub_print.calls
 
-@patch('builtins.input', side_effect=['add', 'cancel', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_cancel_firstnum(mock_print, mock_input):
+def test_calculator_repl_cancel_firstnum(stub_input, stub_print):
+    stub_input(['add', 'cancel', 'exit'])
     calculator_repl()
-    mock_print.assert_any_call("Operation cancelled")
+    assert ("Operation cancelled",) in stub_print.calls
 
-@patch('builtins.input', side_effect=['add','2', 'cancel', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_cancel_secondnum(mock_print, mock_input):
+def test_calculator_repl_cancel_secondnum(stub_input, stub_print):
+    stub_input(['add','2', 'cancel', 'exit'])
     calculator_repl()
-    mock_print.assert_any_call("Operation cancelled")
+    assert ("Operation cancelled",) in stub_print.calls
 
-@patch("app.calculator.Calculator.perform_operation", side_effect=ValidationError("Invalid input"))
-@patch("builtins.input", side_effect=["add", "2", "3", "exit"])
-@patch("builtins.print")
-def test_calculator_repl_validation_error(mock_print, mock_input, mock_perform):
+def test_calculator_repl_validation_error(stub_input, stub_print, monkeypatch):
+    perform_operation = Recorder(error=ValidationError("Invalid input"))
+    monkeypatch.setattr(Calculator, 'perform_operation', perform_operation)
+    stub_input(["add", "2", "3", "exit"])
     calculator_repl()
-    mock_print.assert_any_call("Error: Invalid input")
-    mock_perform.assert_called()
+    assert ("Error: Invalid input",) in stub_print.calls
+    assert perform_operation.calls
 
-@patch("app.calculator.Calculator.perform_operation", side_effect=RuntimeError("Error"))
-@patch("builtins.input", side_effect=["multiply", "2", "3", "exit"])
-@patch("builtins.print")
-def test_calculator_repl_unexpected_error(mock_print, mock_input, mock_perform):
+def test_calculator_repl_unexpected_error(stub_input, stub_print, monkeypatch):
+    perform_operation = Recorder(error=RuntimeError("Error"))
+    monkeypatch.setattr(Calculator, 'perform_operation', perform_operation)
+    stub_input(["multiply", "2", "3", "exit"])
     calculator_repl()
-    mock_print.assert_any_call("Unexpected error: Error")
-    mock_perform.assert_called()
+    assert ("Unexpected error: Error",) in stub_print.calls
+    assert perform_operation.calls
 
-@patch('builtins.input', side_effect=['unknowncmd', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_unknown_command(mock_print, mock_input):
+def test_calculator_repl_unknown_command(stub_input, stub_print):
+    stub_input(['unknowncmd', 'exit'])
     calculator_repl()
-    mock_print.assert_any_call("Unknown command: 'unknowncmd'. Type 'help' for available commands.")
+    assert ("Unknown command: 'unknowncmd'. Type 'help' for available commands.",) in stub_print.calls
 
-@patch("builtins.input", side_effect=[KeyboardInterrupt,"exit"])
-@patch("builtins.print")
-def test_calculator_repl_keyboard_interrupt(mock_print, mock_input):
+def test_calculator_repl_keyboard_interrupt(stub_input, stub_print):
+    stub_input([KeyboardInterrupt, "exit"])
     calculator_repl()
-    mock_print.assert_any_call("\nOperation cancelled")
+    assert ("\nOperation cancelled",) in stub_print.calls
 
-@patch("builtins.input", side_effect=[EOFError,"exit"])
-@patch("builtins.print")
-def test_calculator_repl_keyboard_eof(mock_print, mock_input):
+def test_calculator_repl_keyboard_eof(stub_input, stub_print):
+    stub_input([EOFError, "exit"])
     calculator_repl()
-    mock_print.assert_any_call("\nInput terminated. Exiting...")
+    assert ("\nInput terminated. Exiting...",) in stub_print.calls
 
-@patch("builtins.input", side_effect=[RuntimeError("Error"),"exit"])
-@patch("builtins.print")
-def test_calculator_repl_except_e(mock_print, mock_input):
+def test_calculator_repl_except_e(stub_input, stub_print):
+    stub_input([RuntimeError("Error"), "exit"])
     calculator_repl()
-    mock_print.assert_any_call("Error: Error")
+    assert ("Error: Error",) in stub_print.calls
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from decimal import Decimal
 from typing import Any, Dict, Type
@@ -16,7 +17,8 @@ from app.operations import (
     IntDivide,
     OperationFactory,
     Modulus, 
-    register_operation
+    register_operation,
+    NUMPY_MIN_BATCH
 )
 
 
@@ -49,6 +51,10 @@ class BaseOperationTest:
             result = operation.execute(a, b)
             assert result == expected, f"Failed case: {name}"
 
+    def test_no_instance_dict(self):
+        """Test that operation instances are slotted and carry no __dict__."""
+        assert not hasattr(self.operation_class(), "__dict__")
+
     def test_invalid_operations(self):
         """Test operation with invalid inputs raises appropriate errors."""
         operation = self.operation_class()
@@ -170,6 +176,7 @@ class TestRoot(BaseOperationTest):
         "cube_root": {"a": "27", "b": "3", "expected": "3"},
         "fourth_root": {"a": "16", "b": "4", "expected": "2"},
         "decimal_root": {"a": "2.25", "b": "2", "expected": "1.5"},
+        "first_root": {"a": "7", "b": "1", "expected": "7"},
     }
     invalid_test_cases = {
         "negative_base": {
@@ -264,6 +271,62 @@ class TestModulus(BaseOperationTest):
         },
     }
 
+class TestExecuteMany:
+    """Test batch execution over operand arrays."""
+
+    @pytest.mark.parametrize("size", [3, NUMPY_MIN_BATCH])
+    @pytest.mark.parametrize("operation_class, expected", [
+        (Addition, 8.0),
+        (Subtraction, 4.0),
+        (Multiplication, 12.0),
+        (Division, 3.0),
+        (Power, 36.0),
+        (Modulus, 0.0),
+    ])
+    def test_execute_many(self, operation_class, expected, size):
+        """Test scalar fallback and vectorized path give the same results."""
+        a = np.full(size, 6.0)
+        b = np.full(size, 2.0)
+        result = operation_class.execute_many(a, b)
+        assert result.dtype == np.float64
+        assert np.array_equal(result, np.full(size, expected))
+
+    @pytest.mark.parametrize("size", [3, NUMPY_MIN_BATCH])
+    @pytest.mark.parametrize("operation_class, a_value, b_value, error, message", [
+        (Division, 1.0, 0.0, ValidationError, "Division by zero is not allowed"),
+        (Power, 1.0, -1.0, ValidationError, "Negative exponents not supported"),
+        (Power, -8.0, 0.5, ValueError, "math domain error"),
+        (Power, 10.0, 400.0, OverflowError, "math range error"),
+    ])
+    def test_execute_many_invalid(self, operation_class, a_value, b_value, error, message, size):
+        """Test that batch execution rejects bad rows the same way on both paths."""
+        a = np.ones(size)
+        b = np.ones(size)
+        a[-1] = a_value
+        b[-1] = b_value
+        with pytest.raises(error, match=message):
+            operation_class.execute_many(a, b)
+
+    @pytest.mark.parametrize("size", [3, NUMPY_MIN_BATCH])
+    def test_execute_many_length_mismatch(self, size):
+        """Test mismatched operand arrays are rejected on both paths."""
+        with pytest.raises(ValueError, match=f"Operand length mismatch: {size} first operands, 1 second operands"):
+            Addition.execute_many(np.ones(size), np.ones(1))
+
+    @pytest.mark.parametrize("size", [3, NUMPY_MIN_BATCH])
+    def test_power_execute_many_infinite_base(self, size):
+        """Test infinite bases give inf on both paths, as math.pow does."""
+        a = np.full(size, np.inf)
+        b = np.ones(size)
+        assert np.all(Power.execute_many(a, b) == np.inf)
+
+    def test_power_execute_many_negative_base_integer_exponent(self):
+        """Test a negative base with an integer exponent is allowed on the vectorized path."""
+        a = np.full(NUMPY_MIN_BATCH, -2.0)
+        b = np.full(NUMPY_MIN_BATCH, 3.0)
+        assert np.array_equal(Power.execute_many(a, b), np.full(NUMPY_MIN_BATCH, -8.0))
+
+
 class TestOperationFactory:
     """Test OperationFactory functionality."""
 
@@ -328,4 +391,28 @@ class TestOperationFactory:
         
         op_instance = OperationFactory.create_operation("test_auto_register")
         result = op_instance.execute(Decimal("2"), Decimal("3"))
-        assert result == Decimal("5")
\ No newline at end of file
+        assert result == Decimal("5")
+
+    def test_has_operation(self):
+        """Test membership checks against the registry."""
+        assert OperationFactory.has_operation("add")
+        assert not OperationFactory.has_operation("invalid_op")
+
+    def test_create_operation_reuses_instance(self):
+        """Test that the factory hands out one shared instance per operation."""
+        assert OperationFactory.create_operation("add") is OperationFactory.create_operation("ADD")
+
+    def test_register_operation_replaces_cached_instance(self):
+        """Test that re-registering a name drops the previously cached instance."""
+        class FirstOp(Operation):
+            def execute(self, a: Decimal, b: Decimal) -> Decimal:
+                return a # pragma: no cover
+
+        class SecondOp(Operation):
+            def execute(self, a: Decimal, b: Decimal) -> Decimal:
+                return b # pragma: no cover
+
+        OperationFactory.register_operation("swap_op", FirstOp)
+        assert isinstance(OperationFactory.create_operation("swap_op"), FirstOp)
+        OperationFactory.register_operation("swap_op", SecondOp)
+        assert isinstance(OperationFactory.create_operation("swap_op"), SecondOp)